@@ -20,10 +20,9 @@ from modules.database import (
     update_booking_tee_time,
     fix_all_tee_times
 )
-from modules.ui import get_dashboard_css
+from modules.ui import get_stylesheet_markup
 from modules.utils import (
     extract_tee_time_from_note,
-    get_status_icon,
     get_status_color,
     generate_status_progress_bar
 )
@@ -97,7 +96,9 @@ st.set_page_config(
 # ========================================
 # STYLING - STREAMSONG BRAND
 # ========================================
-st.markdown(get_dashboard_css(), unsafe_allow_html=True)
+# Only a ~60-byte <link> crosses the Python->browser bridge per rerun;
+# the stylesheet itself is served from static/ and cached by the browser
+st.markdown(get_stylesheet_markup(), unsafe_allow_html=True)
 
 
 # ========================================
@@ -506,7 +507,6 @@ if page == "Bookings":
     # BOOKING CARDS - ENHANCED VERSION
     # ========================================
     for idx, booking in filtered_df.iterrows():
-        status_icon = get_status_icon(booking['status'])
         status_class = get_status_color(booking['status'])
     
         tee_time_display = booking.get('tee_time', 'Not Specified')
@@ -1807,6 +1807,7 @@ elif page == "Waitlist":
                             st.success(f"Converted to booking! Booking ID: {booking_id}")
                             st.session_state[f"show_convert_{entry['waitlist_id']}"] = False
                             st.cache_data.clear()
+                            load_bookings_from_db.clear()
                             st.rerun()
                     if cancel_conv:
                         st.session_state[f"show_convert_{entry['waitlist_id']}"] = False
@@ -2032,7 +2033,7 @@ elif page == "Notify Integration":
                 key="download_json"
             )
             with st.expander("Preview JSON"):
-                st.code(json_data[:500] + "...", language="json")
+                st.code(json_data[:500].decode('utf-8', errors='ignore') + "...", language="json")
 
     # CSV Export for Notify
     with st.expander("CSV Export (Notify Format)", expanded=False):
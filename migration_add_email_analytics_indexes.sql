@@ -0,0 +1,24 @@
+-- Migration: Add Email Analytics Covering Indexes
+-- Date: 2026-08-26
+-- Description: Supports the Customer Journey Analytics tab queries with
+--   partial/covering indexes so they stop sequential-scanning bookings
+
+-- 30-day stats aggregate: COUNT(*) FILTER (...) over confirmed bookings
+-- in a date window. Partial index on confirmed rows, covering the two
+-- email timestamps, turns the aggregate into an index-only scan.
+-- CONCURRENTLY avoids locking the table; run outside a transaction.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_bookings_confirmed_date
+ON bookings(date)
+INCLUDE (pre_arrival_email_sent_at, post_play_email_sent_at)
+WHERE status = 'Confirmed';
+
+-- Recent-activity list: rows with either email sent, newest first,
+-- LIMIT 50. The partial index lets the query stop after 50 index tuples.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_bookings_recent_emails
+ON bookings(date DESC)
+WHERE pre_arrival_email_sent_at IS NOT NULL
+   OR post_play_email_sent_at IS NOT NULL;
+
+-- Verify with:
+--   EXPLAIN (ANALYZE, BUFFERS) <analytics queries>
+-- Both should report Index Only Scan / Index Scan instead of Seq Scan.
@@ -6,7 +6,9 @@ from .emails import (
     get_recent_bookings,
     send_welcome_email,
     send_thank_you_email,
-    mark_email_sent
+    send_journey_emails_bulk,
+    mark_email_sent,
+    mark_emails_sent_bulk
 )
 
 __all__ = [
@@ -15,5 +17,7 @@ __all__ = [
     'get_recent_bookings',
     'send_welcome_email',
     'send_thank_you_email',
-    'mark_email_sent'
+    'send_journey_emails_bulk',
+    'mark_email_sent',
+    'mark_emails_sent_bulk'
 ]
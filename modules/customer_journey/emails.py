@@ -7,33 +7,18 @@ Automated emails for golf club bookings:
 
 import streamlit as st
 import os
+import queue
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
+from functools import partial
 from sendgrid import SendGridAPIClient
 from sendgrid.helpers.mail import Mail
 import pandas as pd
 from psycopg.rows import dict_row
 
-from ..database.connection import get_db_connection
-
-
-def extract_tee_time_from_note(note_content):
-    """Extract tee time from email/note content"""
-    if not note_content or pd.isna(note_content):
-        return None
-
-    patterns = [
-        r'Time:\s*(\d{1,2}:\d{2}\s*[AaPp][Mm])',
-        r'time:\s*(\d{1,2}:\d{2}\s*[AaPp][Mm])',
-        r'Tee\s+Time:\s*(\d{1,2}:\d{2}\s*[AaPp][Mm])',
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, str(note_content), re.IGNORECASE)
-        if match:
-            return match.group(1).strip().upper()
-
-    return None
+from ..database.connection import get_pooled_connection
+from ..utils.helpers import extract_tee_time_from_note
 
 
 def extract_tee_time_from_selected_tee_times(selected_tee_times):
@@ -91,239 +76,295 @@ TEMPLATE_POST_PLAY = os.environ.get('SENDGRID_TEMPLATE_POST_PLAY')
 # DATABASE FUNCTIONS
 # ============================================================================
 
-def get_upcoming_bookings(days_ahead=3, show_all=False):
+# Shared projection for the welcome/thank-you queries. Built once so both
+# functions execute a single consistent query text per tracking column,
+# which lets Postgres reuse the prepared plan across calls.
+# Note: 'note' contains email content with tee time info.
+_BOOKING_EMAIL_COLS = """
+            id,
+            booking_id,
+            guest_email,
+            guest_name,
+            date as play_date,
+            tee_time,
+            players,
+            total,
+            golf_courses,
+            selected_tee_times,
+            note,
+            hotel_required,
+            hotel_checkin,
+            hotel_checkout,
+            lodging_nights,
+            lodging_rooms,
+            lodging_room_type,
+            lodging_cost,
+            resort_fee_per_person,
+            resort_fee_total"""
+
+
+@st.cache_resource
+def _has_email_tracking_columns():
+    """True once the journey email migration has been applied
+
+    The schema doesn't change while the app runs, so the
+    information_schema probe happens once per process rather than on
+    every query. After running the migration, restart the app (or call
+    _has_email_tracking_columns.clear()).
+    """
+    with get_pooled_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT 1
+            FROM information_schema.columns
+            WHERE table_name = 'bookings'
+            AND column_name = 'pre_arrival_email_sent_at'
+            LIMIT 1
+        """)
+        found = cursor.fetchone() is not None
+        cursor.close()
+    return found
+
+
+def get_upcoming_bookings(days_ahead=3, show_all=False, only_unsent=False):
     """Get bookings N days from now that need welcome emails
 
     Args:
         days_ahead: Number of days ahead to look (default: 3)
         show_all: If True, show ALL upcoming confirmed bookings
+        only_unsent: If True, filter to bookings without a welcome email
+            in SQL rather than fetching sent rows just to discard them
     """
-    conn = get_db_connection()
-    cursor = conn.cursor(row_factory=dict_row)
+    with get_pooled_connection() as conn:
+        cursor = conn.cursor(row_factory=dict_row)
 
-    if not show_all:
-        target_date = (datetime.now() + timedelta(days=days_ahead)).date()
-    else:
-        target_date = None
-
-    # Check if email tracking columns exist
-    cursor.execute("""
-        SELECT column_name
-        FROM information_schema.columns
-        WHERE table_name = 'bookings'
-        AND column_name IN ('pre_arrival_email_sent_at', 'post_play_email_sent_at')
-    """)
-    existing_cols = [row['column_name'] for row in cursor.fetchall()]
-    has_email_tracking = 'pre_arrival_email_sent_at' in existing_cols
-
-    # Build the WHERE clause based on show_all
-    if show_all:
-        where_clause = "WHERE club = 'streamsong' AND status = 'Confirmed' AND date >= CURRENT_DATE"
-        params = ()
-    else:
-        where_clause = "WHERE club = 'streamsong' AND status = 'Confirmed' AND date = %s"
-        params = (target_date,)
+        if not show_all:
+            target_date = (datetime.now() + timedelta(days=days_ahead)).date()
+        else:
+            target_date = None
 
-    # Note: We fetch 'note' field which contains email content with tee time info
-    if has_email_tracking:
-        cursor.execute(f"""
-            SELECT
-                id,
-                booking_id,
-                guest_email,
-                guest_name,
-                date as play_date,
-                tee_time,
-                players,
-                total,
-                golf_courses,
-                selected_tee_times,
-                note,
-                hotel_required,
-                hotel_checkin,
-                hotel_checkout,
-                lodging_nights,
-                lodging_rooms,
-                lodging_room_type,
-                lodging_cost,
-                resort_fee_per_person,
-                resort_fee_total,
-                pre_arrival_email_sent_at
-            FROM bookings
-            {where_clause}
-            ORDER BY date, tee_time
-        """, params)
-    else:
+        has_email_tracking = _has_email_tracking_columns()
+
+        # Build the WHERE clause based on show_all
+        if show_all:
+            where_clause = "WHERE club = 'streamsong' AND status = 'Confirmed' AND date >= CURRENT_DATE"
+            params = ()
+        else:
+            where_clause = "WHERE club = 'streamsong' AND status = 'Confirmed' AND date = %s"
+            params = (target_date,)
+
+        if only_unsent and has_email_tracking:
+            where_clause += " AND pre_arrival_email_sent_at IS NULL"
+
+        tracking_col = (
+            'pre_arrival_email_sent_at' if has_email_tracking
+            else 'NULL as pre_arrival_email_sent_at'
+        )
         cursor.execute(f"""
-            SELECT
-                id,
-                booking_id,
-                guest_email,
-                guest_name,
-                date as play_date,
-                tee_time,
-                players,
-                total,
-                golf_courses,
-                selected_tee_times,
-                note,
-                hotel_required,
-                hotel_checkin,
-                hotel_checkout,
-                lodging_nights,
-                lodging_rooms,
-                lodging_room_type,
-                lodging_cost,
-                resort_fee_per_person,
-                resort_fee_total,
-                NULL as pre_arrival_email_sent_at
+            SELECT {_BOOKING_EMAIL_COLS},
+                {tracking_col}
             FROM bookings
             {where_clause}
             ORDER BY date, tee_time
-        """, params)
+        """, params, prepare=True)
 
-    bookings = cursor.fetchall()
-    cursor.close()
-    conn.close()
+        bookings = cursor.fetchall()
+        cursor.close()
 
     return bookings
 
 
-def get_recent_bookings(days_ago=2, show_all=False):
+def get_recent_bookings(days_ago=2, show_all=False, only_unsent=False):
     """Get bookings from N days ago that need thank you emails
 
     Args:
         days_ago: Number of days ago to look (default: 2)
         show_all: If True, show ALL recent confirmed bookings (last 30 days)
+        only_unsent: If True, filter to bookings without a thank you email
+            in SQL rather than fetching sent rows just to discard them
     """
-    conn = get_db_connection()
-    cursor = conn.cursor(row_factory=dict_row)
+    with get_pooled_connection() as conn:
+        cursor = conn.cursor(row_factory=dict_row)
 
-    if not show_all:
-        target_date = (datetime.now() - timedelta(days=days_ago)).date()
-    else:
-        target_date = None
-
-    # Check if email tracking columns exist
-    cursor.execute("""
-        SELECT column_name
-        FROM information_schema.columns
-        WHERE table_name = 'bookings'
-        AND column_name IN ('pre_arrival_email_sent_at', 'post_play_email_sent_at')
-    """)
-    existing_cols = [row['column_name'] for row in cursor.fetchall()]
-    has_email_tracking = 'post_play_email_sent_at' in existing_cols
-
-    # Build the WHERE clause based on show_all
-    if show_all:
-        where_clause = "WHERE club = 'streamsong' AND status = 'Confirmed' AND date >= CURRENT_DATE - INTERVAL '30 days'"
-        params = ()
-    else:
-        where_clause = "WHERE club = 'streamsong' AND status = 'Confirmed' AND date = %s"
-        params = (target_date,)
+        if not show_all:
+            target_date = (datetime.now() - timedelta(days=days_ago)).date()
+        else:
+            target_date = None
 
-    if has_email_tracking:
-        cursor.execute(f"""
-            SELECT
-                id,
-                booking_id,
-                guest_email,
-                guest_name,
-                date as play_date,
-                tee_time,
-                players,
-                total,
-                golf_courses,
-                selected_tee_times,
-                note,
-                hotel_required,
-                hotel_checkin,
-                hotel_checkout,
-                lodging_nights,
-                lodging_rooms,
-                lodging_room_type,
-                lodging_cost,
-                resort_fee_per_person,
-                resort_fee_total,
-                post_play_email_sent_at
-            FROM bookings
-            {where_clause}
-            ORDER BY date DESC, guest_email
-        """, params)
-    else:
+        has_email_tracking = _has_email_tracking_columns()
+
+        # Build the WHERE clause based on show_all
+        if show_all:
+            where_clause = "WHERE club = 'streamsong' AND status = 'Confirmed' AND date >= CURRENT_DATE - INTERVAL '30 days'"
+            params = ()
+        else:
+            where_clause = "WHERE club = 'streamsong' AND status = 'Confirmed' AND date = %s"
+            params = (target_date,)
+
+        if only_unsent and has_email_tracking:
+            where_clause += " AND post_play_email_sent_at IS NULL"
+
+        tracking_col = (
+            'post_play_email_sent_at' if has_email_tracking
+            else 'NULL as post_play_email_sent_at'
+        )
         cursor.execute(f"""
-            SELECT
-                id,
-                booking_id,
-                guest_email,
-                guest_name,
-                date as play_date,
-                tee_time,
-                players,
-                total,
-                golf_courses,
-                selected_tee_times,
-                note,
-                hotel_required,
-                hotel_checkin,
-                hotel_checkout,
-                lodging_nights,
-                lodging_rooms,
-                lodging_room_type,
-                lodging_cost,
-                resort_fee_per_person,
-                resort_fee_total,
-                NULL as post_play_email_sent_at
+            SELECT {_BOOKING_EMAIL_COLS},
+                {tracking_col}
             FROM bookings
             {where_clause}
             ORDER BY date DESC, guest_email
-        """, params)
+        """, params, prepare=True)
 
-    bookings = cursor.fetchall()
-    cursor.close()
-    conn.close()
+        bookings = cursor.fetchall()
+        cursor.close()
 
     return bookings
 
 
 def mark_email_sent(booking_id, email_type):
     """Mark email as sent in database"""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-
-    # Check if email tracking columns exist
-    cursor.execute("""
-        SELECT column_name
-        FROM information_schema.columns
-        WHERE table_name = 'bookings'
-        AND column_name IN ('pre_arrival_email_sent_at', 'post_play_email_sent_at')
-    """)
-    existing_cols = [row[0] for row in cursor.fetchall()]
+    has_email_tracking = _has_email_tracking_columns()
 
-    try:
-        if email_type == 'pre_arrival' and 'pre_arrival_email_sent_at' in existing_cols:
-            cursor.execute("""
-                UPDATE bookings
-                SET pre_arrival_email_sent_at = CURRENT_TIMESTAMP
-                WHERE booking_id = %s
-            """, (booking_id,))
-        elif email_type == 'post_play' and 'post_play_email_sent_at' in existing_cols:
-            cursor.execute("""
-                UPDATE bookings
-                SET post_play_email_sent_at = CURRENT_TIMESTAMP
-                WHERE booking_id = %s
-            """, (booking_id,))
-        else:
-            # Column doesn't exist - migration not run yet
-            st.warning("⚠️ Email tracking columns not found. Please run the database migration first.")
+    with get_pooled_connection() as conn:
+        cursor = conn.cursor()
 
-        conn.commit()
-    except Exception as e:
-        conn.rollback()
-        raise e
-    finally:
-        cursor.close()
-        conn.close()
+        try:
+            if email_type == 'pre_arrival' and has_email_tracking:
+                cursor.execute("""
+                    UPDATE bookings
+                    SET pre_arrival_email_sent_at = CURRENT_TIMESTAMP
+                    WHERE booking_id = %s
+                """, (booking_id,))
+            elif email_type == 'post_play' and has_email_tracking:
+                cursor.execute("""
+                    UPDATE bookings
+                    SET post_play_email_sent_at = CURRENT_TIMESTAMP
+                    WHERE booking_id = %s
+                """, (booking_id,))
+            else:
+                # Column doesn't exist - migration not run yet
+                st.warning("⚠️ Email tracking columns not found. Please run the database migration first.")
+
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            raise e
+        finally:
+            cursor.close()
+
+
+def mark_emails_sent_bulk(booking_ids, email_type):
+    """Mark a batch of emails as sent using psycopg pipeline mode
+
+    The updates are sent without waiting for each response, so N bookings
+    cost one pipelined round-trip instead of N.
+    """
+    if not booking_ids:
+        return
+
+    column = {
+        'pre_arrival': 'pre_arrival_email_sent_at',
+        'post_play': 'post_play_email_sent_at',
+    }.get(email_type)
+    if column is None:
+        raise ValueError(f"Unknown email type: {email_type}")
+
+    has_email_tracking = _has_email_tracking_columns()
+
+    with get_pooled_connection() as conn:
+        cursor = conn.cursor()
+
+        try:
+            if has_email_tracking:
+                with conn.pipeline():
+                    for booking_id in booking_ids:
+                        cursor.execute(f"""
+                            UPDATE bookings
+                            SET {column} = CURRENT_TIMESTAMP
+                            WHERE booking_id = %s
+                        """, (booking_id,))
+            else:
+                # Column doesn't exist - migration not run yet
+                st.warning("⚠️ Email tracking columns not found. Please run the database migration first.")
+
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            raise e
+        finally:
+            cursor.close()
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_upcoming_bookings(days_ahead, show_all, only_unsent=False):
+    """Short-lived cache over get_upcoming_bookings for the welcome tab
+
+    Keyed on (days_ahead, show_all, only_unsent); cleared after a send so
+    stale sent_at=None rows don't linger.
+    """
+    return get_upcoming_bookings(days_ahead=days_ahead, show_all=show_all, only_unsent=only_unsent)
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_recent_bookings(days_ago, show_all, only_unsent=False):
+    """Short-lived cache over get_recent_bookings for the thank-you tab"""
+    return get_recent_bookings(days_ago=days_ago, show_all=show_all, only_unsent=only_unsent)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_email_analytics():
+    """Fetch the Analytics tab numbers, cached for a minute
+
+    The tab reruns on every widget interaction anywhere on the page, but
+    these aggregates barely move minute to minute, so cache misses are
+    the only reruns that touch Postgres. Returns plain dicts/lists (not
+    DataFrames) to keep the cache cheap to hash.
+
+    Returns:
+        tuple: (has_email_tracking, stats row or None, recent rows)
+    """
+    has_email_tracking = _has_email_tracking_columns()
+
+    stats = None
+    recent = []
+    if has_email_tracking:
+        with get_pooled_connection() as conn:
+            # Both data queries go out in one pipelined round-trip
+            stats_cursor = conn.cursor(row_factory=dict_row)
+            recent_cursor = conn.cursor(row_factory=dict_row)
+            with conn.pipeline():
+                # 30-day stats
+                stats_cursor.execute("""
+                    SELECT
+                        COUNT(*) FILTER (WHERE pre_arrival_email_sent_at IS NOT NULL) as welcome_sent,
+                        COUNT(*) FILTER (WHERE post_play_email_sent_at IS NOT NULL) as thanks_sent,
+                        COUNT(*) as total_bookings
+                    FROM bookings
+                    WHERE status = 'Confirmed'
+                    AND date >= CURRENT_DATE - INTERVAL '30 days'
+                """)
+
+                # Recent activity
+                recent_cursor.execute("""
+                    SELECT
+                        guest_email,
+                        to_char(date, 'YYYY-MM-DD') as play_date,
+                        pre_arrival_email_sent_at,
+                        post_play_email_sent_at
+                    FROM bookings
+                    WHERE (pre_arrival_email_sent_at IS NOT NULL OR post_play_email_sent_at IS NOT NULL)
+                    AND date >= CURRENT_DATE - INTERVAL '14 days'
+                    ORDER BY date DESC
+                    LIMIT 50
+                """)
+
+            stats = stats_cursor.fetchone()
+            recent = recent_cursor.fetchall()
+            stats_cursor.close()
+            recent_cursor.close()
+
+    return has_email_tracking, stats, recent
 
 
 # ============================================================================
@@ -360,26 +401,43 @@ def get_proshop_items():
     ]
 
 
-def send_welcome_email(booking):
-    """Send welcome email 3 days before play"""
-    try:
-        # DEBUG: Show raw tee_time value from database
-        import streamlit as st
-        tee_time_raw = booking.get('tee_time')
-        selected_tee_times_raw = booking.get('selected_tee_times')
-        note_raw = booking.get('note')
-        st.info(f"🔍 DEBUG - Raw tee_time from DB: {repr(tee_time_raw)}")
-        st.info(f"🔍 DEBUG - Raw selected_tee_times from DB: {repr(selected_tee_times_raw)}")
+def _derive_guest_name(booking):
+    """Get the guest name, falling back to the email local part
+
+    str.partition avoids the throwaway list that split('@') allocates.
+    """
+    return booking.get('guest_name') or booking['guest_email'].partition('@')[0].title()
+
 
+def _send_journey_email(booking, template_id, email_type, template_env_var, mark_sent=True, client=None):
+    """Send a journey email (welcome or thank you) via SendGrid template
+
+    The welcome and thank-you flows are identical apart from the template
+    and tracking column, so both public senders delegate here.
+
+    Args:
+        booking: Booking row as returned by the journey queries
+        template_id: SendGrid dynamic template id
+        email_type: 'pre_arrival' or 'post_play'
+        template_env_var: Env var name to mention when unconfigured
+        mark_sent: Set False when bulk-sending so the caller can record
+            all sends in one pipelined batch via mark_emails_sent_bulk()
+        client: Optional SendGridAPIClient to reuse; bulk senders pass one
+            so the batch shares a single HTTPS connection instead of
+            paying a TLS handshake per message
+
+    Returns:
+        tuple: (success flag, user-facing message)
+    """
+    try:
         # Extract tee time from various sources
-        extracted_from_selected = extract_tee_time_from_selected_tee_times(selected_tee_times_raw)
+        note_raw = booking.get('note')
+        extracted_from_selected = extract_tee_time_from_selected_tee_times(booking.get('selected_tee_times'))
         extracted_from_note = extract_tee_time_from_note(note_raw) if note_raw else None
-        st.info(f"🔍 DEBUG - Tee time extracted from selected_tee_times: {repr(extracted_from_selected)}")
-        st.info(f"🔍 DEBUG - Tee time extracted from note: {repr(extracted_from_note)}")
 
         # Check if SendGrid is configured
-        if not SENDGRID_API_KEY or not FROM_EMAIL or not TEMPLATE_PRE_ARRIVAL:
-            return False, "SendGrid not configured. Please set SENDGRID_API_KEY, FROM_EMAIL, and SENDGRID_TEMPLATE_PRE_ARRIVAL environment variables."
+        if not SENDGRID_API_KEY or not FROM_EMAIL or not template_id:
+            return False, f"SendGrid not configured. Please set SENDGRID_API_KEY, FROM_EMAIL, and {template_env_var} environment variables."
 
         # Validate required fields before sending
         if not booking.get('booking_id'):
@@ -389,7 +447,7 @@ def send_welcome_email(booking):
         if not booking.get('play_date'):
             return False, "❌ Missing play_date"
 
-        guest_name = booking.get('guest_name') or booking['guest_email'].split('@')[0].title()
+        guest_name = _derive_guest_name(booking)
 
         # Format the play date nicely
         play_date = booking['play_date']
@@ -419,7 +477,6 @@ def send_welcome_email(booking):
         # 3. Extract from note field using regex
         # 4. Default to 'TBD'
         tee_time_value = booking.get('tee_time') or extracted_from_selected or extracted_from_note or 'TBD'
-        st.info(f"🔍 DEBUG - Final tee time being sent to SendGrid: {repr(tee_time_value)}")
 
         dynamic_data = {
             # Your template uses these exact field names:
@@ -456,20 +513,19 @@ def send_welcome_email(booking):
             'resort_fee_total': f"${booking.get('resort_fee_total', 0):.2f}" if booking.get('resort_fee_total') else '',
         }
 
-        st.info(f"🔍 DEBUG - Full dynamic_data keys: {list(dynamic_data.keys())}")
-
         message = Mail(
             from_email=(FROM_EMAIL, FROM_NAME),
             to_emails=booking['guest_email']
         )
-        message.template_id = TEMPLATE_PRE_ARRIVAL
+        message.template_id = template_id
         message.dynamic_template_data = dynamic_data
 
-        sg = SendGridAPIClient(SENDGRID_API_KEY)
+        sg = client or SendGridAPIClient(SENDGRID_API_KEY)
         response = sg.send(message)
 
         if response.status_code in [200, 202]:
-            mark_email_sent(booking['booking_id'], 'pre_arrival')
+            if mark_sent:
+                mark_email_sent(booking['booking_id'], email_type)
             return True, "Email sent successfully!"
         else:
             return False, f"SendGrid error: {response.status_code}"
@@ -478,130 +534,326 @@ def send_welcome_email(booking):
         return False, f"Error: {str(e)}"
 
 
-def send_thank_you_email(booking):
-    """Send thank you email 2 days after play"""
-    try:
-        # DEBUG: Show raw tee_time value from database
-        import streamlit as st
-        tee_time_raw = booking.get('tee_time')
-        selected_tee_times_raw = booking.get('selected_tee_times')
-        note_raw = booking.get('note')
-        st.info(f"🔍 DEBUG - Raw tee_time from DB: {repr(tee_time_raw)}")
-        st.info(f"🔍 DEBUG - Raw selected_tee_times from DB: {repr(selected_tee_times_raw)}")
-
-        # Extract tee time from various sources
-        extracted_from_selected = extract_tee_time_from_selected_tee_times(selected_tee_times_raw)
-        extracted_from_note = extract_tee_time_from_note(note_raw) if note_raw else None
-        st.info(f"🔍 DEBUG - Tee time extracted from selected_tee_times: {repr(extracted_from_selected)}")
-        st.info(f"🔍 DEBUG - Tee time extracted from note: {repr(extracted_from_note)}")
-
-        # Check if SendGrid is configured
-        if not SENDGRID_API_KEY or not FROM_EMAIL or not TEMPLATE_POST_PLAY:
-            return False, "SendGrid not configured. Please set SENDGRID_API_KEY, FROM_EMAIL, and SENDGRID_TEMPLATE_POST_PLAY environment variables."
-
-        # Validate required fields before sending
-        if not booking.get('booking_id'):
-            return False, "❌ Missing booking_id"
-        if not booking.get('guest_email'):
-            return False, "❌ Missing guest_email"
-        if not booking.get('play_date'):
-            return False, "❌ Missing play_date"
-
-        guest_name = booking.get('guest_name') or booking['guest_email'].split('@')[0].title()
-
-        # Format the play date nicely
-        play_date = booking['play_date']
-        if hasattr(play_date, 'strftime'):
-            formatted_date = play_date.strftime('%A, %B %d, %Y')
-        else:
-            formatted_date = str(play_date)
-
-        # Format hotel dates if present
-        hotel_checkin_formatted = ''
-        hotel_checkout_formatted = ''
-        if booking.get('hotel_checkin'):
-            if hasattr(booking['hotel_checkin'], 'strftime'):
-                hotel_checkin_formatted = booking['hotel_checkin'].strftime('%A, %B %d, %Y')
-            else:
-                hotel_checkin_formatted = str(booking['hotel_checkin'])
-        if booking.get('hotel_checkout'):
-            if hasattr(booking['hotel_checkout'], 'strftime'):
-                hotel_checkout_formatted = booking['hotel_checkout'].strftime('%A, %B %d, %Y')
-            else:
-                hotel_checkout_formatted = str(booking['hotel_checkout'])
+# Public senders kept for compatibility - welcome goes out 3 days before
+# play, thank you 2 days after
+send_welcome_email = partial(
+    _send_journey_email,
+    template_id=TEMPLATE_PRE_ARRIVAL,
+    email_type='pre_arrival',
+    template_env_var='SENDGRID_TEMPLATE_PRE_ARRIVAL'
+)
+send_thank_you_email = partial(
+    _send_journey_email,
+    template_id=TEMPLATE_POST_PLAY,
+    email_type='post_play',
+    template_env_var='SENDGRID_TEMPLATE_POST_PLAY'
+)
+
+
+# Workers per bulk send. Each send is an HTTPS round-trip to SendGrid, so
+# the batch is latency-bound and a handful of concurrent connections cuts
+# wall time roughly by the worker count. Kept small to stay well clear of
+# provider concurrency limits.
+_BULK_SEND_WORKERS = 5
+
+
+def send_journey_emails_bulk(bookings, email_type):
+    """Send a batch of journey emails in parallel over pooled clients
+
+    Emails go out over SendGrid's HTTPS API, so the per-message overhead
+    to avoid is the TLS handshake a fresh client pays on every send. A
+    small queue of SendGridAPIClient objects is shared by a thread pool:
+    each worker borrows a client for one send and returns it, so
+    connections are reused without being shared between threads.
+
+    Yields (booking, success, message) as sends complete - completion
+    order, not submission order - so the caller can update a progress bar
+    as results arrive. Streamlit calls are only safe from the caller's
+    thread, so do all UI updates in the consuming loop.
+
+    Sends are not marked in the database here - collect the successful
+    booking_ids and pass them to mark_emails_sent_bulk().
+    """
+    sender = send_welcome_email if email_type == 'pre_arrival' else send_thank_you_email
+    bookings = list(bookings)
+    if not bookings:
+        return
+
+    workers = min(_BULK_SEND_WORKERS, len(bookings))
+    clients = queue.Queue()
+    for _ in range(workers):
+        clients.put(SendGridAPIClient(SENDGRID_API_KEY) if SENDGRID_API_KEY else None)
+
+    def _send(booking):
+        client = clients.get()
+        try:
+            success, message = sender(booking, mark_sent=False, client=client)
+        finally:
+            clients.put(client)
+        return booking, success, message
 
-        # === REQUIRED FIELDS - Match your SendGrid template exactly ===
-        # Try multiple sources for tee time:
-        # 1. tee_time column (if it's a simple string)
-        # 2. Extract from selected_tee_times JSON (e.g., {"time": "10:35 AM"})
-        # 3. Extract from note field using regex
-        # 4. Default to 'TBD'
-        tee_time_value = booking.get('tee_time') or extracted_from_selected or extracted_from_note or 'TBD'
-        st.info(f"🔍 DEBUG - Final tee time being sent to SendGrid: {repr(tee_time_value)}")
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_send, booking) for booking in bookings]
+        for future in as_completed(futures):
+            yield future.result()
 
-        dynamic_data = {
-            # Your template uses these exact field names:
-            'guest_name': guest_name,
-            'booking_date': formatted_date,               # Template: {{booking_date}}
-            'course_name': booking.get('golf_courses') or 'Streamsong Golf Resort',  # Template: {{course_name}}
-            'tee_time': tee_time_value,  # Template: {{tee_time}}
-            'player_count': str(booking.get('players', 0)),  # Template: {{player_count}}
-            'booking_reference': booking['booking_id'],    # Template: {{booking_reference}}
-            'product_price': '$98.00',                     # Template: {{product_price}}
-            'current_year': str(datetime.now().year),     # Template: {{current_year}}
 
-            # Backward compatibility (keep these for old templates)
-            'date': formatted_date,
-            'course': booking.get('golf_courses') or 'Streamsong Golf Resort',
-            'players': str(booking.get('players', 0)),
-            'booking_ref': booking['booking_id'],
-            'play_date': formatted_date,
+# ============================================================================
+# STREAMLIT UI
+# ============================================================================
 
-            # Additional details
-            'total': f"${booking.get('total', 0):.2f}" if booking.get('total') else '$0.00',
-            'club_email': FROM_EMAIL,
-            'proshop_items': get_proshop_items(),
+@st.fragment
+def _render_welcome_tab():
+    """Welcome emails tab - sent 3 days before play"""
+    st.subheader("Welcome Emails - Send 3 Days Before Play")
 
-            # Hotel information
-            'hotel_required': 'Yes' if booking.get('hotel_required') else 'No',
-            'hotel_checkin': hotel_checkin_formatted,
-            'hotel_checkout': hotel_checkout_formatted,
-            'lodging_nights': str(booking.get('lodging_nights') or 0),
-            'lodging_rooms': str(booking.get('lodging_rooms') or 0),
-            'lodging_room_type': booking.get('lodging_room_type') or '',
-            'lodging_cost': f"${booking.get('lodging_cost', 0):.2f}" if booking.get('lodging_cost') else '',
-            'resort_fee_per_person': f"${booking.get('resort_fee_per_person', 0):.2f}" if booking.get('resort_fee_per_person') else '',
-            'resort_fee_total': f"${booking.get('resort_fee_total', 0):.2f}" if booking.get('resort_fee_total') else '',
-        }
+    # Add checkbox to show all bookings
+    show_all_upcoming = st.checkbox("📋 Show all upcoming bookings (send immediately)", key="show_all_upcoming")
 
-        st.info(f"🔍 DEBUG - Full dynamic_data keys: {list(dynamic_data.keys())}")
+    # Cached for 30s so button clicks and reruns don't re-query the
+    # database; cleared right after a send
+    bookings = _cached_upcoming_bookings(3, show_all_upcoming)
 
-        message = Mail(
-            from_email=(FROM_EMAIL, FROM_NAME),
-            to_emails=booking['guest_email']
+    if not bookings:
+        if show_all_upcoming:
+            st.info("No upcoming confirmed bookings found")
+        else:
+            target_date = (datetime.now() + timedelta(days=3)).date()
+            st.info(f"No bookings scheduled for {target_date.strftime('%B %d, %Y')} (3 days from now)")
+    else:
+        if show_all_upcoming:
+            st.success(f"**{len(bookings)} upcoming bookings** (send immediately to any)")
+        else:
+            target_date = bookings[0]['play_date']
+            st.success(f"**{len(bookings)} bookings** scheduled for {target_date.strftime('%B %d, %Y')}")
+
+        # One data_editor with a checkbox column replaces per-row
+        # widgets - a single element on every rerun regardless of how
+        # many bookings are listed
+        editor_df = pd.DataFrame(bookings)[
+            ['booking_id', 'guest_email', 'play_date', 'tee_time', 'players', 'pre_arrival_email_sent_at']
+        ]
+        editor_df.insert(0, 'send', False)
+        edited = st.data_editor(
+            editor_df,
+            column_config={
+                'send': st.column_config.CheckboxColumn('Send', default=False),
+                'booking_id': 'Booking',
+                'guest_email': 'Guest',
+                'play_date': st.column_config.DateColumn('Play Date', format='MMM DD'),
+                'tee_time': 'Tee Time',
+                'players': 'Players',
+                'pre_arrival_email_sent_at': st.column_config.DatetimeColumn(
+                    'Welcome Email Sent', format='MMM DD, h:mm a'
+                ),
+            },
+            disabled=['booking_id', 'guest_email', 'play_date', 'tee_time', 'players', 'pre_arrival_email_sent_at'],
+            hide_index=True,
+            use_container_width=True,
+            key="welcome_editor"
         )
-        message.template_id = TEMPLATE_POST_PLAY
-        message.dynamic_template_data = dynamic_data
-
-        sg = SendGridAPIClient(SENDGRID_API_KEY)
-        response = sg.send(message)
 
-        if response.status_code in [200, 202]:
-            mark_email_sent(booking['booking_id'], 'post_play')
-            return True, "Email sent successfully!"
+        bookings_by_id = {b['booking_id']: b for b in bookings}
+        selected_welcome = edited.loc[edited['send'], 'booking_id'].tolist()
+        if selected_welcome and st.button("Send Welcome Emails to Selected", key="send_selected_welcome"):
+            progress = st.progress(0)
+            status = st.empty()
+
+            sent_ids = []
+            selected = [bookings_by_id[bid] for bid in selected_welcome]
+            for i, (booking, success, message) in enumerate(send_journey_emails_bulk(selected, 'pre_arrival')):
+                status.text(f"Sent {i + 1}/{len(selected)}...")
+                if success:
+                    sent_ids.append(booking['booking_id'])
+                else:
+                    st.error(f"{booking['guest_email']}: {message}")
+                progress.progress((i + 1) / len(selected))
+
+            mark_emails_sent_bulk(sent_ids, 'pre_arrival')
+
+            status.text("")
+            progress.empty()
+            st.success(f"✅ Sent {len(sent_ids)}/{len(selected_welcome)} emails")
+            _cached_upcoming_bookings.clear()
+            st.rerun(scope="fragment")
+
+        # Bulk send button - filter to unsent rows in SQL so already-sent
+        # bookings never leave the database
+        unsent = _cached_upcoming_bookings(3, show_all_upcoming, only_unsent=True)
+        if unsent:
+            st.markdown("---")
+            if st.button(f"📨 Send All ({len(unsent)} emails)", type="primary", key="bulk_welcome"):
+                progress = st.progress(0)
+                status = st.empty()
+
+                sent_ids = []
+                for i, (booking, success, _) in enumerate(send_journey_emails_bulk(unsent, 'pre_arrival')):
+                    status.text(f"Sent {i + 1}/{len(unsent)}...")
+                    if success:
+                        sent_ids.append(booking['booking_id'])
+                    progress.progress((i + 1) / len(unsent))
+
+                # Record all successful sends in one pipelined batch
+                mark_emails_sent_bulk(sent_ids, 'pre_arrival')
+
+                status.text("")
+                progress.empty()
+                st.success(f"✅ Sent {len(sent_ids)}/{len(unsent)} emails")
+                _cached_upcoming_bookings.clear()
+                st.rerun(scope="fragment")
+
+
+@st.fragment
+def _render_thanks_tab():
+    """Thank you emails tab - sent 2 days after play"""
+    st.subheader("Thank You Emails - Send 2 Days After Play")
+
+    # Add checkbox to show all bookings
+    show_all_recent = st.checkbox("📋 Show all recent bookings (last 30 days, send immediately)", key="show_all_recent")
+
+    # Same short-lived cache pattern as the welcome tab
+    bookings = _cached_recent_bookings(2, show_all_recent)
+
+    if not bookings:
+        if show_all_recent:
+            st.info("No recent confirmed bookings found (last 30 days)")
         else:
-            return False, f"SendGrid error: {response.status_code}"
-
-    except Exception as e:
-        return False, f"Error: {str(e)}"
+            target_date = (datetime.now() - timedelta(days=2)).date()
+            st.info(f"No bookings from {target_date.strftime('%B %d, %Y')} (2 days ago)")
+    else:
+        if show_all_recent:
+            st.success(f"**{len(bookings)} recent bookings** (last 30 days - send immediately to any)")
+        else:
+            target_date = bookings[0]['play_date']
+            st.success(f"**{len(bookings)} guests** played on {target_date.strftime('%B %d, %Y')}")
+
+        # Same data_editor + checkbox pattern as the welcome tab
+        editor_df = pd.DataFrame(bookings)[
+            ['booking_id', 'guest_email', 'play_date', 'post_play_email_sent_at']
+        ]
+        editor_df.insert(0, 'send', False)
+        edited = st.data_editor(
+            editor_df,
+            column_config={
+                'send': st.column_config.CheckboxColumn('Send', default=False),
+                'booking_id': 'Booking',
+                'guest_email': 'Guest',
+                'play_date': st.column_config.DateColumn('Play Date', format='MMM DD, YYYY'),
+                'post_play_email_sent_at': st.column_config.DatetimeColumn(
+                    'Thank You Email Sent', format='MMM DD, h:mm a'
+                ),
+            },
+            disabled=['booking_id', 'guest_email', 'play_date', 'post_play_email_sent_at'],
+            hide_index=True,
+            use_container_width=True,
+            key="thanks_editor"
+        )
 
+        bookings_by_id = {b['booking_id']: b for b in bookings}
+        selected_thanks = edited.loc[edited['send'], 'booking_id'].tolist()
+        if selected_thanks and st.button("Send Thank You Emails to Selected", key="send_selected_thanks"):
+            progress = st.progress(0)
+            status = st.empty()
+
+            sent_ids = []
+            selected = [bookings_by_id[bid] for bid in selected_thanks]
+            for i, (booking, success, message) in enumerate(send_journey_emails_bulk(selected, 'post_play')):
+                status.text(f"Sent {i + 1}/{len(selected)}...")
+                if success:
+                    sent_ids.append(booking['booking_id'])
+                else:
+                    st.error(f"{booking['guest_email']}: {message}")
+                progress.progress((i + 1) / len(selected))
+
+            mark_emails_sent_bulk(sent_ids, 'post_play')
+
+            status.text("")
+            progress.empty()
+            st.success(f"✅ Sent {len(sent_ids)}/{len(selected_thanks)} emails")
+            _cached_recent_bookings.clear()
+            st.rerun(scope="fragment")
+
+        # Bulk send - same SQL-side unsent filter as the welcome tab
+        unsent = _cached_recent_bookings(2, show_all_recent, only_unsent=True)
+        if unsent:
+            st.markdown("---")
+            if st.button(f"📨 Send All ({len(unsent)} emails)", type="primary", key="bulk_thanks"):
+                progress = st.progress(0)
+                status = st.empty()
+
+                sent_ids = []
+                for i, (booking, success, _) in enumerate(send_journey_emails_bulk(unsent, 'post_play')):
+                    status.text(f"Sent {i + 1}/{len(unsent)}...")
+                    if success:
+                        sent_ids.append(booking['booking_id'])
+                    progress.progress((i + 1) / len(unsent))
+
+                # Record all successful sends in one pipelined batch
+                mark_emails_sent_bulk(sent_ids, 'post_play')
+
+                status.text("")
+                progress.empty()
+                st.success(f"✅ Sent {len(sent_ids)}/{len(unsent)} emails")
+                _cached_recent_bookings.clear()
+                st.rerun(scope="fragment")
+
+
+@st.fragment
+def _render_analytics_tab():
+    """Email analytics tab"""
+    st.subheader("📊 Email Analytics")
+
+    if st.button("🔄 Refresh", key="refresh_analytics"):
+        _fetch_email_analytics.clear()
+
+    has_email_tracking, stats, recent = _fetch_email_analytics()
+
+    if not has_email_tracking:
+        st.warning("⚠️ Email tracking columns not found. Please run the database migration first:")
+        st.code("psql $DATABASE_URL < migration_add_journey_emails.sql")
+        return
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.metric("Total Bookings (30d)", stats['total_bookings'])
+
+    with col2:
+        st.metric("Welcome Emails Sent", stats['welcome_sent'])
+        if stats['total_bookings'] > 0:
+            pct = (stats['welcome_sent'] / stats['total_bookings']) * 100
+            st.caption(f"{pct:.0f}% coverage")
+
+    with col3:
+        st.metric("Thank You Emails Sent", stats['thanks_sent'])
+        if stats['total_bookings'] > 0:
+            pct = (stats['thanks_sent'] / stats['total_bookings']) * 100
+            st.caption(f"{pct:.0f}% coverage")
+
+    st.markdown("---")
+
+    if recent:
+        st.markdown("### 📅 Recent Email Activity")
+        df = pd.DataFrame(recent)
+
+        # Vectorized timestamp formatting; NaT rows become '-'
+        df['pre_arrival_email_sent_at'] = pd.to_datetime(
+            df['pre_arrival_email_sent_at']
+        ).dt.strftime('%m/%d %I:%M%p').fillna('-')
+        df['post_play_email_sent_at'] = pd.to_datetime(
+            df['post_play_email_sent_at']
+        ).dt.strftime('%m/%d %I:%M%p').fillna('-')
+
+        st.dataframe(df, use_container_width=True, hide_index=True)
 
-# ============================================================================
-# STREAMLIT UI
-# ============================================================================
 
 def render_customer_journey_page():
-    """Main function - renders the customer journey emails page"""
+    """Main function - renders the customer journey emails page
+
+    Each tab body is a fragment, so a widget interaction inside one tab
+    reruns only that tab - clicking send in the welcome tab never runs
+    the thank-you or analytics queries.
+    """
 
     st.title("📧 Customer Journey Emails")
     st.markdown("Manage welcome and thank you emails for your guests")
@@ -613,237 +865,11 @@ def render_customer_journey_page():
         "📊 Analytics"
     ])
 
-    # ========================================================================
-    # TAB 1: WELCOME EMAILS (3 days before)
-    # ========================================================================
     with tab1:
-        st.subheader("Welcome Emails - Send 3 Days Before Play")
+        _render_welcome_tab()
 
-        # Add checkbox to show all bookings
-        show_all_upcoming = st.checkbox("📋 Show all upcoming bookings (send immediately)", key="show_all_upcoming")
-
-        bookings = get_upcoming_bookings(days_ahead=3, show_all=show_all_upcoming)
-
-        if not bookings:
-            if show_all_upcoming:
-                st.info("No upcoming confirmed bookings found")
-            else:
-                target_date = (datetime.now() + timedelta(days=3)).date()
-                st.info(f"No bookings scheduled for {target_date.strftime('%B %d, %Y')} (3 days from now)")
-        else:
-            if show_all_upcoming:
-                st.success(f"**{len(bookings)} upcoming bookings** (send immediately to any)")
-            else:
-                target_date = bookings[0]['play_date']
-                st.success(f"**{len(bookings)} bookings** scheduled for {target_date.strftime('%B %d, %Y')}")
-
-            # Display each booking
-            for booking in bookings:
-                col1, col2, col3 = st.columns([3, 2, 2])
-
-                with col1:
-                    st.markdown(f"**{booking['guest_email']}**")
-                    date_str = booking['play_date'].strftime('%b %d') if hasattr(booking['play_date'], 'strftime') else str(booking['play_date'])
-                    st.caption(f"📅 {date_str} • 🕐 {booking.get('tee_time', 'TBD')} • {booking['players']} players")
-
-                with col2:
-                    if booking['pre_arrival_email_sent_at']:
-                        st.success(f"✅ Sent {booking['pre_arrival_email_sent_at'].strftime('%b %d, %I:%M %p')}")
-                    else:
-                        st.warning("⏳ Not sent yet")
-
-                with col3:
-                    button_label = "Resend" if booking['pre_arrival_email_sent_at'] else "Send Welcome Email"
-                    if st.button(button_label, key=f"welcome_{booking['booking_id']}"):
-                        with st.spinner("Sending..."):
-                            success, message = send_welcome_email(booking)
-                            if success:
-                                st.success(message)
-                                st.rerun()
-                            else:
-                                st.error(message)
-
-                st.divider()
-
-            # Bulk send button
-            unsent = [b for b in bookings if not b['pre_arrival_email_sent_at']]
-            if unsent:
-                st.markdown("---")
-                if st.button(f"📨 Send All ({len(unsent)} emails)", type="primary", key="bulk_welcome"):
-                    progress = st.progress(0)
-                    status = st.empty()
-
-                    sent_count = 0
-                    for i, booking in enumerate(unsent):
-                        status.text(f"Sending to {booking['guest_email']}...")
-                        success, _ = send_welcome_email(booking)
-                        if success:
-                            sent_count += 1
-                        progress.progress((i + 1) / len(unsent))
-
-                    status.text("")
-                    progress.empty()
-                    st.success(f"✅ Sent {sent_count}/{len(unsent)} emails")
-                    st.rerun()
-
-    # ========================================================================
-    # TAB 2: THANK YOU EMAILS (2 days after)
-    # ========================================================================
     with tab2:
-        st.subheader("Thank You Emails - Send 2 Days After Play")
-
-        # Add checkbox to show all bookings
-        show_all_recent = st.checkbox("📋 Show all recent bookings (last 30 days, send immediately)", key="show_all_recent")
-
-        bookings = get_recent_bookings(days_ago=2, show_all=show_all_recent)
+        _render_thanks_tab()
 
-        if not bookings:
-            if show_all_recent:
-                st.info("No recent confirmed bookings found (last 30 days)")
-            else:
-                target_date = (datetime.now() - timedelta(days=2)).date()
-                st.info(f"No bookings from {target_date.strftime('%B %d, %Y')} (2 days ago)")
-        else:
-            if show_all_recent:
-                st.success(f"**{len(bookings)} recent bookings** (last 30 days - send immediately to any)")
-            else:
-                target_date = bookings[0]['play_date']
-                st.success(f"**{len(bookings)} guests** played on {target_date.strftime('%B %d, %Y')}")
-
-            for booking in bookings:
-                col1, col2, col3 = st.columns([3, 2, 2])
-
-                with col1:
-                    st.markdown(f"**{booking['guest_email']}**")
-                    st.caption(f"Played on {booking['play_date'].strftime('%b %d, %Y')}")
-
-                with col2:
-                    if booking['post_play_email_sent_at']:
-                        st.success(f"✅ Sent {booking['post_play_email_sent_at'].strftime('%b %d, %I:%M %p')}")
-                    else:
-                        st.warning("⏳ Not sent yet")
-
-                with col3:
-                    button_label = "Resend" if booking['post_play_email_sent_at'] else "Send Thank You"
-                    if st.button(button_label, key=f"thanks_{booking['booking_id']}"):
-                        with st.spinner("Sending..."):
-                            success, message = send_thank_you_email(booking)
-                            if success:
-                                st.success(message)
-                                st.rerun()
-                            else:
-                                st.error(message)
-
-                st.divider()
-
-            # Bulk send
-            unsent = [b for b in bookings if not b['post_play_email_sent_at']]
-            if unsent:
-                st.markdown("---")
-                if st.button(f"📨 Send All ({len(unsent)} emails)", type="primary", key="bulk_thanks"):
-                    progress = st.progress(0)
-                    status = st.empty()
-
-                    sent_count = 0
-                    for i, booking in enumerate(unsent):
-                        status.text(f"Sending to {booking['guest_email']}...")
-                        success, _ = send_thank_you_email(booking)
-                        if success:
-                            sent_count += 1
-                        progress.progress((i + 1) / len(unsent))
-
-                    status.text("")
-                    progress.empty()
-                    st.success(f"✅ Sent {sent_count}/{len(unsent)} emails")
-                    st.rerun()
-
-    # ========================================================================
-    # TAB 3: ANALYTICS
-    # ========================================================================
     with tab3:
-        st.subheader("📊 Email Analytics")
-
-        conn = get_db_connection()
-        cursor = conn.cursor(row_factory=dict_row)
-
-        # Check if email tracking columns exist
-        cursor.execute("""
-            SELECT column_name
-            FROM information_schema.columns
-            WHERE table_name = 'bookings'
-            AND column_name IN ('pre_arrival_email_sent_at', 'post_play_email_sent_at')
-        """)
-        existing_cols = [row['column_name'] for row in cursor.fetchall()]
-        has_email_tracking = len(existing_cols) > 0
-
-        if not has_email_tracking:
-            st.warning("⚠️ Email tracking columns not found. Please run the database migration first:")
-            st.code("psql $DATABASE_URL < migration_add_journey_emails.sql")
-            cursor.close()
-            conn.close()
-            return
-
-        # Get 30-day stats
-        cursor.execute("""
-            SELECT
-                COUNT(*) FILTER (WHERE pre_arrival_email_sent_at IS NOT NULL) as welcome_sent,
-                COUNT(*) FILTER (WHERE post_play_email_sent_at IS NOT NULL) as thanks_sent,
-                COUNT(*) as total_bookings
-            FROM bookings
-            WHERE status = 'Confirmed'
-            AND date >= CURRENT_DATE - INTERVAL '30 days'
-        """)
-
-        stats = cursor.fetchone()
-
-        col1, col2, col3 = st.columns(3)
-
-        with col1:
-            st.metric("Total Bookings (30d)", stats['total_bookings'])
-
-        with col2:
-            st.metric("Welcome Emails Sent", stats['welcome_sent'])
-            if stats['total_bookings'] > 0:
-                pct = (stats['welcome_sent'] / stats['total_bookings']) * 100
-                st.caption(f"{pct:.0f}% coverage")
-
-        with col3:
-            st.metric("Thank You Emails Sent", stats['thanks_sent'])
-            if stats['total_bookings'] > 0:
-                pct = (stats['thanks_sent'] / stats['total_bookings']) * 100
-                st.caption(f"{pct:.0f}% coverage")
-
-        st.markdown("---")
-
-        # Recent activity
-        cursor.execute("""
-            SELECT
-                guest_email,
-                date as play_date,
-                pre_arrival_email_sent_at,
-                post_play_email_sent_at
-            FROM bookings
-            WHERE (pre_arrival_email_sent_at IS NOT NULL OR post_play_email_sent_at IS NOT NULL)
-            AND date >= CURRENT_DATE - INTERVAL '14 days'
-            ORDER BY date DESC
-            LIMIT 50
-        """)
-
-        recent = cursor.fetchall()
-        cursor.close()
-        conn.close()
-
-        if recent:
-            st.markdown("### 📅 Recent Email Activity")
-            df = pd.DataFrame(recent)
-            df['play_date'] = pd.to_datetime(df['play_date']).dt.strftime('%Y-%m-%d')
-
-            # Handle None values in timestamp columns
-            df['pre_arrival_email_sent_at'] = df['pre_arrival_email_sent_at'].apply(
-                lambda x: x.strftime('%m/%d %I:%M%p') if pd.notna(x) else '-'
-            )
-            df['post_play_email_sent_at'] = df['post_play_email_sent_at'].apply(
-                lambda x: x.strftime('%m/%d %I:%M%p') if pd.notna(x) else '-'
-            )
-
-            st.dataframe(df, use_container_width=True, hide_index=True)
+        _render_analytics_tab()
@@ -1,5 +1,5 @@
 """Database operations module"""
-from .connection import get_db_connection
+from .connection import get_db_connection, get_pooled_connection
 from .bookings import (
     load_bookings_from_db,
     update_booking_status,
@@ -11,6 +11,7 @@ from .bookings import (
 
 __all__ = [
     'get_db_connection',
+    'get_pooled_connection',
     'load_bookings_from_db',
     'update_booking_status',
     'update_booking_note',
@@ -2,15 +2,20 @@
 import pandas as pd
 import streamlit as st
 from psycopg.rows import dict_row
-from .connection import get_db_connection
-from ..utils.helpers import extract_tee_time_from_note
+from .connection import get_pooled_connection
+from ..utils.helpers import extract_tee_time_from_note, extract_tee_times_series
 
 
-@st.cache_data(ttl=10)
+@st.cache_resource(ttl=10)
 def load_bookings_from_db(club_filter):
     """
     Load bookings from PostgreSQL database
 
+    Cached with st.cache_resource so hits return the frame as-is instead
+    of paying cache_data's pickle round-trip on a 27-column DataFrame.
+    The returned frame is therefore SHARED across reruns and sessions -
+    callers must .copy() before mutating it.
+
     Args:
         club_filter (str): Club identifier to filter bookings
 
@@ -18,31 +23,44 @@ def load_bookings_from_db(club_filter):
         tuple: (DataFrame of bookings, source identifier)
     """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor(row_factory=dict_row)
-
-        cursor.execute("""
-            SELECT
-                id, booking_id, guest_email, date, tee_time, players, total,
-                status, note, club, timestamp, customer_confirmed_at,
-                updated_at, updated_by, created_at, hotel_required,
-                hotel_checkin, hotel_checkout, golf_courses, selected_tee_times,
-                lodging_nights, lodging_rooms, lodging_room_type,
-                lodging_preferences, lodging_cost,
-                resort_fee_per_person, resort_fee_total
-            FROM bookings
-            WHERE club = %s
-            ORDER BY timestamp DESC
-        """, (club_filter,))
-
-        bookings = cursor.fetchall()
-        cursor.close()
-        conn.close()
+        with get_pooled_connection() as conn:
+            # Plain tuple rows - dict_row would allocate a 27-key dict per
+            # booking just for pandas to unpack it again
+            cursor = conn.cursor()
+
+            # Defaults are projected in SQL so the DataFrame arrives
+            # ready to use - no per-column fillna passes afterwards
+            cursor.execute("""
+                SELECT
+                    id,
+                    COALESCE(booking_id, 'BOOK-' || LPAD(id::text, 4, '0')) AS booking_id,
+                    COALESCE(guest_email, 'No email provided') AS guest_email,
+                    date,
+                    COALESCE(tee_time, 'Not Specified') AS tee_time,
+                    COALESCE(players, 1) AS players,
+                    COALESCE(total, 0.0) AS total,
+                    COALESCE(status, 'Inquiry') AS status,
+                    COALESCE(note, 'No additional information provided') AS note,
+                    club, timestamp, customer_confirmed_at,
+                    updated_at, updated_by, created_at,
+                    COALESCE(hotel_required, false) AS hotel_required,
+                    hotel_checkin, hotel_checkout, golf_courses, selected_tee_times,
+                    lodging_nights, lodging_rooms, lodging_room_type,
+                    lodging_preferences, lodging_cost,
+                    resort_fee_per_person, resort_fee_total
+                FROM bookings
+                WHERE club = %s
+                ORDER BY timestamp DESC
+            """, (club_filter,))
+
+            bookings = cursor.fetchall()
+            columns = [desc.name for desc in cursor.description]
+            cursor.close()
 
         if not bookings:
             return pd.DataFrame(), 'postgresql'
 
-        df = pd.DataFrame(bookings)
+        df = pd.DataFrame(bookings, columns=columns)
 
         # Ensure all datetime columns are properly converted
         for col in ['timestamp', 'customer_confirmed_at', 'updated_at', 'created_at']:
@@ -52,60 +70,17 @@ def load_bookings_from_db(club_filter):
         if 'date' in df.columns:
             df['date'] = pd.to_datetime(df['date'], errors='coerce')
 
-        # Ensure tee_time exists and handle None/NaN values
-        if 'tee_time' not in df.columns:
-            df['tee_time'] = 'Not Specified'
-        else:
-            df['tee_time'] = df['tee_time'].fillna('Not Specified')
-
-        # Extract tee times from note content if not already set
-        for idx in df.index:
-            current_tee_time = df.at[idx, 'tee_time']
-            if current_tee_time in ['Not Specified', None, ''] or pd.isna(current_tee_time):
-                note_content = df.at[idx, 'note']
-                extracted_time = extract_tee_time_from_note(note_content)
-                if extracted_time:
-                    df.at[idx, 'tee_time'] = extracted_time
-
-        # Ensure note column exists and handle None/NaN
-        if 'note' not in df.columns:
-            df['note'] = 'No additional information provided'
-        else:
-            df['note'] = df['note'].fillna('No additional information provided')
-
-        # Ensure all required columns have proper defaults
-        if 'status' not in df.columns:
-            df['status'] = 'Inquiry'
-
-        if 'players' not in df.columns:
-            df['players'] = 1
-        else:
-            df['players'] = df['players'].fillna(1)
-
-        if 'total' not in df.columns:
-            df['total'] = 0.0
-        else:
-            df['total'] = df['total'].fillna(0.0)
-
-        if 'guest_email' not in df.columns:
-            df['guest_email'] = 'No email provided'
-        else:
-            df['guest_email'] = df['guest_email'].fillna('No email provided')
-
-        if 'booking_id' not in df.columns:
-            df['booking_id'] = df.index.map(lambda x: f'BOOK-{x:04d}')
-
-        if 'hotel_required' not in df.columns:
-            df['hotel_required'] = False
-        else:
-            df['hotel_required'] = df['hotel_required'].fillna(False)
-
-        # Ensure hotel date columns exist
+        # Extract tee times from note content if not already set - one
+        # C-level str.extract pass over just the rows that need it
+        mask = df['tee_time'].isin(['Not Specified', ''])
+        if mask.any():
+            extracted = extract_tee_times_series(df.loc[mask, 'note'])
+            df.loc[mask, 'tee_time'] = extracted.fillna(df.loc[mask, 'tee_time'])
+
+        # Hotel dates still go through pandas - it copes with mixed
+        # date/datetime values better than a SQL cast would
         for col in ['hotel_checkin', 'hotel_checkout']:
-            if col in df.columns:
-                df[col] = pd.to_datetime(df[col], errors='coerce')
-            else:
-                df[col] = None
+            df[col] = pd.to_datetime(df[col], errors='coerce')
 
         return df, 'postgresql'
     except Exception as e:
@@ -128,18 +103,20 @@ def update_booking_status(booking_id: str, new_status: str, updated_by: str):
         bool: True if successful, False otherwise
     """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        with get_pooled_connection() as conn:
+            cursor = conn.cursor()
 
-        cursor.execute("""
-            UPDATE bookings
-            SET status = %s, updated_at = NOW(), updated_by = %s
-            WHERE booking_id = %s;
-        """, (new_status, updated_by, booking_id))
+            cursor.execute("""
+                UPDATE bookings
+                SET status = %s, updated_at = NOW(), updated_by = %s
+                WHERE booking_id = %s;
+            """, (new_status, updated_by, booking_id))
 
-        conn.commit()
-        cursor.close()
-        conn.close()
+            conn.commit()
+            cursor.close()
+
+        # Drop the shared cached frame so the next load sees this write
+        load_bookings_from_db.clear()
 
         # Store the new status in session state to auto-include in filter
         if 'auto_include_status' not in st.session_state:
@@ -164,18 +141,19 @@ def update_booking_note(booking_id: str, note: str):
         bool: True if successful, False otherwise
     """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            UPDATE bookings
-            SET note = %s, updated_at = NOW()
-            WHERE booking_id = %s;
-        """, (note, booking_id))
-
-        conn.commit()
-        cursor.close()
-        conn.close()
+        with get_pooled_connection() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute("""
+                UPDATE bookings
+                SET note = %s, updated_at = NOW()
+                WHERE booking_id = %s;
+            """, (note, booking_id))
+
+            conn.commit()
+            cursor.close()
+
+        load_bookings_from_db.clear()
         return True
     except Exception as e:
         st.error(f"Error updating note: {e}")
@@ -193,17 +171,18 @@ def delete_booking(booking_id: str):
         bool: True if successful, False otherwise
     """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        with get_pooled_connection() as conn:
+            cursor = conn.cursor()
 
-        cursor.execute("""
-            DELETE FROM bookings
-            WHERE booking_id = %s;
-        """, (booking_id,))
+            cursor.execute("""
+                DELETE FROM bookings
+                WHERE booking_id = %s;
+            """, (booking_id,))
 
-        conn.commit()
-        cursor.close()
-        conn.close()
+            conn.commit()
+            cursor.close()
+
+        load_bookings_from_db.clear()
         return True
     except Exception as e:
         st.error(f"Error deleting booking: {e}")
@@ -222,18 +201,19 @@ def update_booking_tee_time(booking_id: str, tee_time: str):
         bool: True if successful, False otherwise
     """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            UPDATE bookings
-            SET tee_time = %s, updated_at = NOW()
-            WHERE booking_id = %s;
-        """, (tee_time, booking_id))
-
-        conn.commit()
-        cursor.close()
-        conn.close()
+        with get_pooled_connection() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute("""
+                UPDATE bookings
+                SET tee_time = %s, updated_at = NOW()
+                WHERE booking_id = %s;
+            """, (tee_time, booking_id))
+
+            conn.commit()
+            cursor.close()
+
+        load_bookings_from_db.clear()
         return True
     except Exception as e:
         st.error(f"Error updating tee time: {e}")
@@ -251,47 +231,69 @@ def fix_all_tee_times(club_filter):
         tuple: (updated_count, not_found_count)
     """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor(row_factory=dict_row)
+        with get_pooled_connection() as conn:
+            cursor = conn.cursor(row_factory=dict_row)
+
+            # Common case: the note carries "Time: HH:MM AM/PM" (or "Tee
+            # Time: ..."). Extract and backfill entirely server-side so the
+            # note text never has to leave Postgres
+            cursor.execute(r"""
+                UPDATE bookings
+                SET tee_time = upper(btrim((regexp_match(note, 'Time:\s*(\d{1,2}:\d{2}\s*[AP]M)', 'i'))[1])),
+                    updated_at = NOW()
+                WHERE club = %s
+                  AND (tee_time IS NULL OR tee_time = 'Not Specified' OR tee_time = '')
+                  AND note ~* 'Time:\s*\d{1,2}:\d{2}\s*[AP]M';
+            """, (club_filter,))
+            sql_updated_count = cursor.rowcount
+
+            # Fallback: run whatever is still missing through the Python
+            # extractor in case a note format slips past the SQL pattern
+            cursor.execute("""
+                SELECT id, booking_id, note, tee_time
+                FROM bookings
+                WHERE club = %s
+                  AND (tee_time IS NULL OR tee_time = 'Not Specified' OR tee_time = '');
+            """, (club_filter,))
+
+            bookings = cursor.fetchall()
+
+            if not bookings:
+                conn.commit()
+                cursor.close()
+                if sql_updated_count:
+                    load_bookings_from_db.clear()
+                return sql_updated_count, 0
+
+            # Collect (id, extracted_time) pairs first, then apply them in a
+            # single UPDATE ... FROM (VALUES ...) - one round-trip and one
+            # query plan instead of one per booking
+            rows = []
+            not_found_count = 0
+
+            for booking in bookings:
+                extracted_time = extract_tee_time_from_note(booking['note'])
+                if extracted_time:
+                    rows.append((booking['id'], extracted_time))
+                else:
+                    not_found_count += 1
 
-        # Get all bookings with missing or "Not Specified" tee times
-        cursor.execute("""
-            SELECT id, booking_id, note, tee_time
-            FROM bookings
-            WHERE club = %s
-              AND (tee_time IS NULL OR tee_time = 'Not Specified' OR tee_time = '');
-        """, (club_filter,))
+            updated_count = sql_updated_count + len(rows)
 
-        bookings = cursor.fetchall()
+            if rows:
+                placeholders = ", ".join(["(%s, %s)"] * len(rows))
+                params = [value for row in rows for value in row]
+                cursor.execute(f"""
+                    UPDATE bookings
+                    SET tee_time = data.tee_time, updated_at = NOW()
+                    FROM (VALUES {placeholders}) AS data(id, tee_time)
+                    WHERE bookings.id = data.id;
+                """, params)
 
-        if not bookings:
+            conn.commit()
             cursor.close()
-            conn.close()
-            return 0, 0
-
-        updated_count = 0
-        not_found_count = 0
-
-        for booking in bookings:
-            note = booking['note']
-            extracted_time = extract_tee_time_from_note(note)
-
-            if extracted_time:
-                # Update the booking
-                cursor.execute("""
-                    UPDATE bookings
-                    SET tee_time = %s, updated_at = NOW()
-                    WHERE id = %s;
-                """, (extracted_time, booking['id']))
-                updated_count += 1
-            else:
-                not_found_count += 1
-
-        # Commit all updates
-        conn.commit()
-        cursor.close()
-        conn.close()
 
+        load_bookings_from_db.clear()
         return updated_count, not_found_count
 
     except Exception as e:
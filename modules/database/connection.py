@@ -1,7 +1,11 @@
 """Database connection utilities"""
 import os
+from contextlib import contextmanager
+
 import psycopg
+import streamlit as st
 from psycopg.rows import dict_row
+from psycopg_pool import ConnectionPool
 
 
 def get_db_connection():
@@ -20,6 +24,39 @@ def get_db_connection():
     return psycopg.connect(database_url)
 
 
+@st.cache_resource
+def _get_pool():
+    """
+    Create the shared connection pool (one per process)
+
+    Returns:
+        ConnectionPool: Pool of reusable database connections
+
+    Raises:
+        ValueError: If DATABASE_URL environment variable is not set
+    """
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        raise ValueError("DATABASE_URL environment variable not set")
+    return ConnectionPool(conninfo=database_url, min_size=2, max_size=8)
+
+
+@contextmanager
+def get_pooled_connection():
+    """
+    Check out a connection from the shared pool
+
+    Avoids the TCP + TLS + auth handshake that psycopg.connect() pays on
+    every call. The connection is returned to the pool on exit; the
+    transaction is committed on clean exit and rolled back on error.
+
+    Yields:
+        psycopg.Connection: Pooled database connection
+    """
+    with _get_pool().connection() as conn:
+        yield conn
+
+
 def execute_query(query, params=None, fetch_one=False, fetch_all=True):
     """
     Execute a database query with automatic connection handling
@@ -33,21 +70,20 @@ def execute_query(query, params=None, fetch_one=False, fetch_all=True):
     Returns:
         Result of query execution or None
     """
-    conn = get_db_connection()
-    cursor = conn.cursor(row_factory=dict_row)
+    with get_pooled_connection() as conn:
+        cursor = conn.cursor(row_factory=dict_row)
 
-    try:
-        cursor.execute(query, params)
+        try:
+            cursor.execute(query, params)
 
-        if fetch_one:
-            result = cursor.fetchone()
-        elif fetch_all:
-            result = cursor.fetchall()
-        else:
-            conn.commit()
-            result = cursor.rowcount
+            if fetch_one:
+                result = cursor.fetchone()
+            elif fetch_all:
+                result = cursor.fetchall()
+            else:
+                conn.commit()
+                result = cursor.rowcount
 
-        return result
-    finally:
-        cursor.close()
-        conn.close()
+            return result
+        finally:
+            cursor.close()
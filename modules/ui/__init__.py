@@ -1,7 +1,8 @@
 """UI components and styling module"""
-from .styles import STREAMSONG_COLORS, get_dashboard_css
+from .styles import STREAMSONG_COLORS, get_dashboard_css, get_stylesheet_markup
 
 __all__ = [
     'STREAMSONG_COLORS',
-    'get_dashboard_css'
+    'get_dashboard_css',
+    'get_stylesheet_markup'
 ]
@@ -1,4 +1,7 @@
 """Styling constants and CSS generation"""
+import re
+from functools import lru_cache
+from pathlib import Path
 
 # Streamsong Brand Color Palette
 STREAMSONG_COLORS = {
@@ -17,15 +20,44 @@ STREAMSONG_COLORS = {
 }
 
 
-def get_dashboard_css():
+# Served by Streamlit's static file server (enableStaticServing in
+# .streamlit/config.toml); the browser caches the stylesheet so only the
+# <link> tag crosses the Python->JS bridge on each rerun
+_STATIC_CSS_PATH = Path(__file__).resolve().parents[2] / 'static' / 'streamsong.css'
+_CSS_LINK = '<link rel="stylesheet" href="app/static/streamsong.css">'
+
+
+def _minify_css(css):
     """
-    Generate CSS for Streamsong dashboard
+    Strip whitespace the browser doesn't need
+
+    Collapses runs of whitespace and drops spaces around CSS punctuation -
+    roughly halves the stylesheet without changing any rule.
+
+    Args:
+        css (str): Readable CSS rules
 
     Returns:
-        str: CSS stylesheet as string
+        str: Minified CSS rules
     """
-    return f"""
-    <style>
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{}:;,])\s*', r'\1', css)
+    return css.strip()
+
+
+@lru_cache(maxsize=1)
+def _build_css():
+    """
+    Generate the raw CSS rules for the Streamsong dashboard
+
+    The palette is fixed, so the f-string interpolation and minification
+    run once per process; every call after that returns the same cached
+    string.
+
+    Returns:
+        str: Minified CSS rules as string (no <style> wrapper)
+    """
+    return _minify_css(f"""
     .main {{
         background: {STREAMSONG_COLORS['background_dark']};
         font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', sans-serif;
@@ -290,5 +322,38 @@ def get_dashboard_css():
     #MainMenu {{visibility: hidden;}}
     footer {{visibility: hidden;}}
     header {{visibility: hidden;}}
-    </style>
+    """)
+
+
+def get_dashboard_css():
+    """
+    Generate CSS for Streamsong dashboard as an inline <style> block
+
+    Returns:
+        str: CSS stylesheet wrapped in <style> tags
+    """
+    return f"<style>{_build_css()}</style>"
+
+
+@lru_cache(maxsize=1)
+def get_stylesheet_markup():
+    """
+    Get the markup to inject the dashboard stylesheet
+
+    Writes the generated CSS to static/streamsong.css (refreshed when the
+    palette changes) and returns a <link> tag pointing at it, so reruns
+    ship ~60 bytes instead of the whole stylesheet. Falls back to the
+    inline <style> block if the static file cannot be written.
+
+    Returns:
+        str: HTML snippet to pass to st.markdown(..., unsafe_allow_html=True)
     """
+    css = _build_css()
+    try:
+        if not _STATIC_CSS_PATH.exists() or _STATIC_CSS_PATH.read_text() != css:
+            _STATIC_CSS_PATH.parent.mkdir(exist_ok=True)
+            _STATIC_CSS_PATH.write_text(css)
+        return _CSS_LINK
+    except OSError:
+        # Read-only deployment - ship the CSS inline like before
+        return get_dashboard_css()
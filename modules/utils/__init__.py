@@ -1,14 +1,14 @@
 """Utility functions module"""
 from .helpers import (
     extract_tee_time_from_note,
-    get_status_icon,
+    extract_tee_times_series,
     get_status_color,
     generate_status_progress_bar
 )
 
 __all__ = [
     'extract_tee_time_from_note',
-    'get_status_icon',
+    'extract_tee_times_series',
     'get_status_color',
     'generate_status_progress_bar'
 ]
@@ -1,6 +1,12 @@
 """Helper utility functions"""
 import re
-import pandas as pd
+from functools import lru_cache
+
+# Compiled once at import - extract_tee_time_from_note runs per booking
+# row on the load path, so the pattern shouldn't go through the re cache
+# lookup on every call. One pattern covers both "Time:" and "Tee Time:"
+# since search() finds "Time:" inside the longer label anyway.
+_TEE_TIME_RE = re.compile(r'(?:Tee\s+)?Time:\s*(\d{1,2}:\d{2}\s*[AP]M)', re.IGNORECASE)
 
 
 def extract_tee_time_from_note(note_content):
@@ -17,46 +23,48 @@ def extract_tee_time_from_note(note_content):
     Returns:
         str or None: Extracted tee time or None if not found
     """
-    if not note_content or pd.isna(note_content):
+    # NaN check without a pandas dispatch - notes are strings or float NaN
+    if not note_content or note_content != note_content:
         return None
 
-    # Pattern to match "Time: HH:MM AM/PM"
-    patterns = [
-        r'Time:\s*(\d{1,2}:\d{2}\s*[AaPp][Mm])',  # Time: 12:20 PM
-        r'time:\s*(\d{1,2}:\d{2}\s*[AaPp][Mm])',  # time: 12:20 pm (case insensitive)
-        r'Tee\s+Time:\s*(\d{1,2}:\d{2}\s*[AaPp][Mm])',  # Tee Time: 12:20 PM
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, str(note_content), re.IGNORECASE)
-        if match:
-            tee_time = match.group(1).strip()
-            # Normalize to uppercase (12:20 PM)
-            return tee_time.upper()
+    match = _TEE_TIME_RE.search(str(note_content))
+    if match:
+        # Normalize to uppercase (12:20 PM)
+        return match.group(1).strip().upper()
 
     return None
 
 
-def get_status_icon(status: str) -> str:
+def extract_tee_times_series(notes):
     """
-    Get timeline icon for booking status
+    Extract tee times from a whole notes column at once.
+
+    One Series.str.extract pass with the compiled pattern instead of a
+    Python call per row - use this on DataFrame paths, keep
+    extract_tee_time_from_note for single values.
 
     Args:
-        status (str): Booking status
+        notes (pd.Series): Column of note/email content
 
     Returns:
-        str: Icon for status (currently empty for text-only display)
+        pd.Series: Extracted tee times, NaN where none was found
     """
-    status_icons = {
-        'Inquiry': '',
-        'Requested': '',
-        'Confirmed': '',
-        'Booked': '',
-        'Rejected': '',
-        'Cancelled': '',
-        'Pending': '',
-    }
-    return status_icons.get(status, '')
+    return notes.astype('string').str.extract(_TEE_TIME_RE, expand=False).str.strip().str.upper()
+
+
+# Status lookup table built once at import - this helper runs per
+# booking card in the render loop, so the dict literal (and the .get
+# attribute lookup) shouldn't be rebuilt on every call
+_STATUS_COLORS = {
+    'Inquiry': 'status-inquiry',
+    'Requested': 'status-requested',
+    'Confirmed': 'status-confirmed',
+    'Booked': 'status-booked',
+    'Rejected': 'status-rejected',
+    'Cancelled': 'status-cancelled',
+    'Pending': 'status-requested',
+}
+_STATUS_COLOR_GET = _STATUS_COLORS.get
 
 
 def get_status_color(status: str) -> str:
@@ -69,22 +77,18 @@ def get_status_color(status: str) -> str:
     Returns:
         str: CSS class name for status
     """
-    status_map = {
-        'Inquiry': 'status-inquiry',
-        'Requested': 'status-requested',
-        'Confirmed': 'status-confirmed',
-        'Booked': 'status-booked',
-        'Rejected': 'status-rejected',
-        'Cancelled': 'status-cancelled',
-        'Pending': 'status-requested',
-    }
-    return status_map.get(status, 'status-inquiry')
+    return _STATUS_COLOR_GET(status, 'status-inquiry')
 
 
+@lru_cache(maxsize=8)
 def generate_status_progress_bar(current_status: str) -> str:
     """
     Generate a linear status progress bar showing booking workflow
 
+    There are only a handful of distinct statuses, so the rendered HTML
+    is memoized - repeat statuses in a long booking list cost one dict
+    lookup instead of rebuilding the markup.
+
     Args:
         current_status (str): Current booking status
 
@@ -121,22 +125,15 @@ def generate_status_progress_bar(current_status: str) -> str:
     # Find current stage index
     current_index = next((i for i, s in enumerate(stages) if s['name'] == current_status), 0)
 
-    # Generate HTML
-    html = """
+    # Collect chunks and join once at the end - repeated += on a string
+    # reallocates the whole buffer on each append
+    progress_width = (current_index / (len(stages) - 1)) * 100 if len(stages) > 1 else 0
+    parts = [f"""
     <div style='background: #3d5266; padding: 1.25rem; border-radius: 8px; border: 2px solid #6b7c3f;'>
         <div style='display: flex; align-items: center; justify-content: space-between; position: relative;'>
-    """
-
-    # Add connecting line
-    html += """
         <div style='position: absolute; top: 1rem; left: 2rem; right: 2rem; height: 3px; background: #4a6278; z-index: 1;'></div>
-    """
-
-    # Add progress line (only up to current stage)
-    progress_width = (current_index / (len(stages) - 1)) * 100 if len(stages) > 1 else 0
-    html += f"""
         <div style='position: absolute; top: 1rem; left: 2rem; width: calc({progress_width}% - 2rem); height: 3px; background: linear-gradient(90deg, #87a7b3, #6b7c3f); z-index: 2;'></div>
-    """
+    """]
 
     # Add stage nodes
     for i, stage in enumerate(stages):
@@ -147,7 +144,7 @@ def generate_status_progress_bar(current_status: str) -> str:
         text_color = '#f7f5f2' if is_active else '#999999'
         border_color = stage['color'] if is_current else ('#6b7c3f' if is_active else '#4a6278')
 
-        html += f"""
+        parts.append(f"""
         <div style='display: flex; flex-direction: column; align-items: center; z-index: 3; position: relative;'>
             <div style='
                 width: 1.5rem;
@@ -169,11 +166,11 @@ def generate_status_progress_bar(current_status: str) -> str:
                 white-space: nowrap;
             '>{stage['name']}</div>
         </div>
-        """
+        """)
 
-    html += """
+    parts.append("""
         </div>
     </div>
-    """
+    """)
 
-    return html
+    return ''.join(parts)
@@ -3,71 +3,116 @@ import streamlit as st
 import pandas as pd
 from datetime import datetime
 from psycopg.rows import dict_row
-from modules.database import get_db_connection
+from modules.database import get_pooled_connection
+
+# The CREATE TABLE IF NOT EXISTS below is idempotent but still a DB
+# round-trip - once it has succeeded there is no reason to re-issue it
+# for the lifetime of the process
+_TABLE_READY = False
+
+# Fixed schema for DataFrame construction - from_records with explicit
+# columns/dtypes skips pandas' per-row dict-key scan and type inference.
+# Order matches the CREATE TABLE below.
+_WAITLIST_COLUMNS = [
+    'id', 'waitlist_id', 'guest_email', 'guest_name', 'requested_date',
+    'preferred_time', 'time_flexibility', 'players', 'golf_course',
+    'status', 'priority', 'notes', 'notification_sent',
+    'notification_sent_at', 'created_at', 'updated_at', 'club'
+]
+
+_WAITLIST_DTYPES = {
+    'requested_date': 'datetime64[ns]',
+    'notification_sent_at': 'datetime64[ns]',
+    'created_at': 'datetime64[ns]',
+    'updated_at': 'datetime64[ns]',
+    'players': 'Int64',
+    'priority': 'Int64',
+}
+
+# Explicit projection instead of SELECT * - rows arrive in
+# _WAITLIST_COLUMNS order regardless of physical column order
+_WAITLIST_SELECT = ", ".join(_WAITLIST_COLUMNS)
 
 
 def create_waitlist_table_if_not_exists():
     """Ensure waitlist table exists in database"""
+    global _TABLE_READY
+    if _TABLE_READY:
+        return True
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS waitlist (
-                id SERIAL PRIMARY KEY,
-                waitlist_id VARCHAR(50) UNIQUE NOT NULL,
-                guest_email VARCHAR(255) NOT NULL,
-                guest_name VARCHAR(255),
-                requested_date DATE NOT NULL,
-                preferred_time VARCHAR(50),
-                time_flexibility VARCHAR(50) DEFAULT 'Flexible',
-                players INTEGER DEFAULT 1,
-                golf_course VARCHAR(255),
-                status VARCHAR(50) DEFAULT 'Waiting',
-                priority INTEGER DEFAULT 5,
-                notes TEXT,
-                notification_sent BOOLEAN DEFAULT FALSE,
-                notification_sent_at TIMESTAMP,
-                created_at TIMESTAMP DEFAULT NOW(),
-                updated_at TIMESTAMP DEFAULT NOW(),
-                club VARCHAR(100) NOT NULL
-            );
-        """)
-        conn.commit()
-        cursor.close()
-        conn.close()
+        with get_pooled_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS waitlist (
+                    id SERIAL PRIMARY KEY,
+                    waitlist_id VARCHAR(50) UNIQUE NOT NULL,
+                    guest_email VARCHAR(255) NOT NULL,
+                    guest_name VARCHAR(255),
+                    requested_date DATE NOT NULL,
+                    preferred_time VARCHAR(50),
+                    time_flexibility VARCHAR(50) DEFAULT 'Flexible',
+                    players INTEGER DEFAULT 1,
+                    golf_course VARCHAR(255),
+                    status VARCHAR(50) DEFAULT 'Waiting',
+                    priority INTEGER DEFAULT 5,
+                    notes TEXT,
+                    notification_sent BOOLEAN DEFAULT FALSE,
+                    notification_sent_at TIMESTAMP,
+                    created_at TIMESTAMP DEFAULT NOW(),
+                    updated_at TIMESTAMP DEFAULT NOW(),
+                    club VARCHAR(100) NOT NULL
+                );
+            """)
+
+            # Matches the load_waitlist_from_db ORDER BY so the planner
+            # can walk the index instead of sorting
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_waitlist_club_date_prio
+                ON waitlist(club, requested_date ASC, priority DESC, created_at ASC);
+            """)
+
+            # get_waitlist_matches only ever looks at Waiting entries
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_waitlist_waiting
+                ON waitlist(club, requested_date, priority DESC, created_at ASC)
+                WHERE status = 'Waiting';
+            """)
+
+            conn.commit()
+            cursor.close()
+        _TABLE_READY = True
         return True
     except Exception as e:
         st.error(f"Error creating waitlist table: {e}")
         return False
 
 
+@st.cache_data(ttl=30, show_spinner=False)
 def load_waitlist_from_db(club_filter):
-    """Load waitlist entries from database"""
+    """Load waitlist entries from database
+
+    Cached per club for 30s; the waitlist mutators call .clear() so
+    writes show up on the next rerun without waiting out the TTL.
+    """
     try:
         create_waitlist_table_if_not_exists()
-        conn = get_db_connection()
-        cursor = conn.cursor(row_factory=dict_row)
+        with get_pooled_connection() as conn:
+            cursor = conn.cursor(row_factory=dict_row)
 
-        cursor.execute("""
-            SELECT * FROM waitlist
-            WHERE club = %s
-            ORDER BY requested_date ASC, priority DESC, created_at ASC
-        """, (club_filter,))
+            cursor.execute(f"""
+                SELECT {_WAITLIST_SELECT} FROM waitlist
+                WHERE club = %s
+                ORDER BY requested_date ASC, priority DESC, created_at ASC
+            """, (club_filter,))
 
-        waitlist = cursor.fetchall()
-        cursor.close()
-        conn.close()
+            waitlist = cursor.fetchall()
+            cursor.close()
 
         if not waitlist:
             return pd.DataFrame()
 
-        df = pd.DataFrame(waitlist)
-
-        for col in ['requested_date', 'created_at', 'updated_at', 'notification_sent_at']:
-            if col in df.columns:
-                df[col] = pd.to_datetime(df[col], errors='coerce')
-
-        return df
+        df = pd.DataFrame.from_records(waitlist, columns=_WAITLIST_COLUMNS)
+        return df.astype(_WAITLIST_DTYPES)
     except Exception as e:
         st.error(f"Error loading waitlist: {e}")
         return pd.DataFrame()
@@ -78,22 +123,34 @@ def add_to_waitlist(guest_email, guest_name, requested_date, preferred_time,
     """Add a new entry to the waitlist"""
     try:
         create_waitlist_table_if_not_exists()
-        conn = get_db_connection()
-        cursor = conn.cursor()
-
-        waitlist_id = f"WL-{datetime.now().strftime('%Y%m%d%H%M%S')}-{hash(guest_email) % 10000:04d}"
-
-        cursor.execute("""
-            INSERT INTO waitlist (
-                waitlist_id, guest_email, guest_name, requested_date, preferred_time,
-                time_flexibility, players, golf_course, notes, club, priority
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """, (waitlist_id, guest_email, guest_name, requested_date, preferred_time,
-              time_flexibility, players, golf_course, notes, club, priority))
-
-        conn.commit()
-        cursor.close()
-        conn.close()
+        with get_pooled_connection() as conn:
+            cursor = conn.cursor()
+
+            # Derive waitlist_id from the SERIAL id sequence instead of
+            # timestamp + hash(guest_email) - no Python-side hashing and
+            # no same-second collisions, since the sequence is unique by
+            # construction
+            cursor.execute("""
+                WITH seq AS (
+                    SELECT nextval(pg_get_serial_sequence('waitlist', 'id')) AS id
+                )
+                INSERT INTO waitlist (
+                    id, waitlist_id, guest_email, guest_name, requested_date,
+                    preferred_time, time_flexibility, players, golf_course,
+                    notes, club, priority
+                )
+                SELECT seq.id, 'WL-' || lpad(seq.id::text, 10, '0'),
+                       %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
+                FROM seq
+                RETURNING waitlist_id
+            """, (guest_email, guest_name, requested_date, preferred_time,
+                  time_flexibility, players, golf_course, notes, club, priority))
+
+            waitlist_id = cursor.fetchone()[0]
+            conn.commit()
+            cursor.close()
+        load_waitlist_from_db.clear()
+        get_waitlist_matches_raw.clear()
         return True, waitlist_id
     except Exception as e:
         st.error(f"Error adding to waitlist: {e}")
@@ -103,26 +160,27 @@ def add_to_waitlist(guest_email, guest_name, requested_date, preferred_time,
 def update_waitlist_status(waitlist_id, new_status, send_notification=False):
     """Update waitlist entry status"""
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-
-        if send_notification:
-            cursor.execute("""
-                UPDATE waitlist
-                SET status = %s, notification_sent = TRUE,
-                    notification_sent_at = NOW(), updated_at = NOW()
-                WHERE waitlist_id = %s
-            """, (new_status, waitlist_id))
-        else:
-            cursor.execute("""
-                UPDATE waitlist
-                SET status = %s, updated_at = NOW()
-                WHERE waitlist_id = %s
-            """, (new_status, waitlist_id))
-
-        conn.commit()
-        cursor.close()
-        conn.close()
+        with get_pooled_connection() as conn:
+            cursor = conn.cursor()
+
+            if send_notification:
+                cursor.execute("""
+                    UPDATE waitlist
+                    SET status = %s, notification_sent = TRUE,
+                        notification_sent_at = NOW(), updated_at = NOW()
+                    WHERE waitlist_id = %s
+                """, (new_status, waitlist_id))
+            else:
+                cursor.execute("""
+                    UPDATE waitlist
+                    SET status = %s, updated_at = NOW()
+                    WHERE waitlist_id = %s
+                """, (new_status, waitlist_id))
+
+            conn.commit()
+            cursor.close()
+        load_waitlist_from_db.clear()
+        get_waitlist_matches_raw.clear()
         return True
     except Exception as e:
         st.error(f"Error updating waitlist: {e}")
@@ -132,84 +190,178 @@ def update_waitlist_status(waitlist_id, new_status, send_notification=False):
 def delete_waitlist_entry(waitlist_id):
     """Delete a waitlist entry"""
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM waitlist WHERE waitlist_id = %s", (waitlist_id,))
-        conn.commit()
-        cursor.close()
-        conn.close()
+        with get_pooled_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM waitlist WHERE waitlist_id = %s", (waitlist_id,))
+            conn.commit()
+            cursor.close()
+        load_waitlist_from_db.clear()
+        get_waitlist_matches_raw.clear()
         return True
     except Exception as e:
         st.error(f"Error deleting waitlist entry: {e}")
         return False
 
 
-def get_waitlist_matches(club_filter, available_date, available_time=None):
-    """Find waitlist entries that match an available tee time"""
+@st.cache_data(ttl=10, show_spinner=False)
+def get_waitlist_matches_raw(club_filter, available_date, available_time=None):
+    """Find waitlist entries that match an available tee time
+
+    Returns the rows as a plain list of dicts - match lists are a
+    handful of rows consumed by notification loops, where DataFrame
+    construction is pure overhead. Short TTL keyed on (club, date,
+    time): consulted repeatedly while staff work through an opening,
+    but must not go stale for long.
+    """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor(row_factory=dict_row)
-
-        query = """
-            SELECT * FROM waitlist
-            WHERE club = %s
-            AND requested_date = %s
-            AND status = 'Waiting'
-            ORDER BY priority DESC, created_at ASC
-        """
-        cursor.execute(query, (club_filter, available_date))
-
-        matches = cursor.fetchall()
-        cursor.close()
-        conn.close()
-
-        return pd.DataFrame(matches) if matches else pd.DataFrame()
+        with get_pooled_connection() as conn:
+            cursor = conn.cursor(row_factory=dict_row)
+
+            query = f"""
+                SELECT {_WAITLIST_SELECT} FROM waitlist
+                WHERE club = %s
+                AND requested_date = %s
+                AND status = 'Waiting'
+                ORDER BY priority DESC, created_at ASC
+            """
+            cursor.execute(query, (club_filter, available_date))
+
+            matches = cursor.fetchall()
+            cursor.close()
+
+        return matches
     except Exception as e:
         st.error(f"Error finding waitlist matches: {e}")
-        return pd.DataFrame()
+        return []
+
+
+def get_waitlist_matches(club_filter, available_date, available_time=None):
+    """DataFrame wrapper around get_waitlist_matches_raw
+
+    Use the raw variant unless a DataFrame is actually needed.
+    """
+    matches = get_waitlist_matches_raw(club_filter, available_date, available_time)
+    return pd.DataFrame(matches) if matches else pd.DataFrame()
 
 
 def convert_waitlist_to_booking(waitlist_entry, tee_time, total_amount=0):
     """Convert a waitlist entry to a booking"""
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-
-        booking_id = f"BOOK-{datetime.now().strftime('%Y%m%d%H%M%S')}"
-
-        cursor.execute("""
-            INSERT INTO bookings (
-                booking_id, guest_email, date, tee_time, players, total,
-                status, note, club, timestamp, golf_courses
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, NOW(), %s)
-        """, (
-            booking_id,
-            waitlist_entry['guest_email'],
-            waitlist_entry['requested_date'],
-            tee_time,
-            waitlist_entry['players'],
-            total_amount,
-            'Confirmed',
-            f"Converted from waitlist: {waitlist_entry['waitlist_id']}. {waitlist_entry.get('notes', '')}",
-            waitlist_entry['club'],
-            waitlist_entry.get('golf_course', '')
-        ))
-
-        cursor.execute("""
-            UPDATE waitlist
-            SET status = 'Converted', updated_at = NOW()
-            WHERE waitlist_id = %s
-        """, (waitlist_entry['waitlist_id'],))
-
-        conn.commit()
-        cursor.close()
-        conn.close()
+        with get_pooled_connection() as conn:
+            cursor = conn.cursor()
+
+            booking_id = f"BOOK-{datetime.now().strftime('%Y%m%d%H%M%S')}"
+
+            # Single statement: INSERT the booking and flip the waitlist
+            # row in one round-trip, atomically - no window where the
+            # booking exists but the entry still reads 'Waiting'
+            cursor.execute("""
+                WITH ins AS (
+                    INSERT INTO bookings (
+                        booking_id, guest_email, date, tee_time, players, total,
+                        status, note, club, timestamp, golf_courses
+                    ) VALUES (
+                        %s, %s, %s, %s, %s, %s, 'Confirmed',
+                        CONCAT('Converted from waitlist: ', %s::text, '. ', COALESCE(%s, '')),
+                        %s, NOW(), %s
+                    )
+                )
+                UPDATE waitlist
+                SET status = 'Converted', updated_at = NOW()
+                WHERE waitlist_id = %s
+            """, (
+                booking_id,
+                waitlist_entry['guest_email'],
+                waitlist_entry['requested_date'],
+                tee_time,
+                waitlist_entry['players'],
+                total_amount,
+                waitlist_entry['waitlist_id'],
+                waitlist_entry.get('notes', ''),
+                waitlist_entry['club'],
+                waitlist_entry.get('golf_course', ''),
+                waitlist_entry['waitlist_id']
+            ))
+
+            conn.commit()
+            cursor.close()
+        load_waitlist_from_db.clear()
+        get_waitlist_matches_raw.clear()
         return True, booking_id
     except Exception as e:
         st.error(f"Error converting waitlist to booking: {e}")
         return False, None
 
 
+def convert_waitlist_batch(conversions, total_amount=0):
+    """Convert several waitlist entries to bookings in one batched round-trip
+
+    Args:
+        conversions: list of (waitlist_entry, tee_time) pairs
+        total_amount: booking total applied to every conversion
+
+    Returns:
+        tuple: (True, list of booking_ids) or (False, []) on error
+    """
+    if not conversions:
+        return True, []
+    try:
+        with get_pooled_connection() as conn:
+            cursor = conn.cursor()
+
+            # One timestamp for the batch; the per-row suffix keeps
+            # booking_ids unique within the same second
+            stamp = datetime.now().strftime('%Y%m%d%H%M%S')
+            rows = []
+            booking_ids = []
+            waitlist_ids = []
+
+            for i, (entry, tee_time) in enumerate(conversions):
+                booking_id = f"BOOK-{stamp}-{i + 1:02d}"
+                rows.append((
+                    booking_id,
+                    entry['guest_email'],
+                    entry['requested_date'],
+                    tee_time,
+                    entry['players'],
+                    total_amount,
+                    entry['waitlist_id'],
+                    entry.get('notes', ''),
+                    entry['club'],
+                    entry.get('golf_course', '')
+                ))
+                booking_ids.append(booking_id)
+                waitlist_ids.append(entry['waitlist_id'])
+
+            # psycopg batches executemany over a pipeline - the whole
+            # insert set goes out in one flush instead of N round-trips
+            cursor.executemany("""
+                INSERT INTO bookings (
+                    booking_id, guest_email, date, tee_time, players, total,
+                    status, note, club, timestamp, golf_courses
+                ) VALUES (
+                    %s, %s, %s, %s, %s, %s, 'Confirmed',
+                    CONCAT('Converted from waitlist: ', %s::text, '. ', COALESCE(%s, '')),
+                    %s, NOW(), %s
+                )
+            """, rows)
+
+            cursor.execute("""
+                UPDATE waitlist
+                SET status = 'Converted', updated_at = NOW()
+                WHERE waitlist_id = ANY(%s)
+            """, (waitlist_ids,))
+
+            conn.commit()
+            cursor.close()
+        load_waitlist_from_db.clear()
+        get_waitlist_matches_raw.clear()
+        return True, booking_ids
+    except Exception as e:
+        st.error(f"Error converting waitlist batch: {e}")
+        return False, []
+
+
 __all__ = [
     'create_waitlist_table_if_not_exists',
     'load_waitlist_from_db',
@@ -217,5 +369,7 @@ __all__ = [
     'update_waitlist_status',
     'delete_waitlist_entry',
     'get_waitlist_matches',
-    'convert_waitlist_to_booking'
+    'get_waitlist_matches_raw',
+    'convert_waitlist_to_booking',
+    'convert_waitlist_batch'
 ]
@@ -0,0 +1,30 @@
+"""Optional Cython build for the hot helper module
+
+The dashboard runs fine as pure Python. If Cython and a C compiler are
+available, this compiles modules/utils/helpers.py (regex extraction and
+HTML building called per booking row during render) into an extension
+module that Python picks up automatically in place of the .py file:
+
+    pip install cython
+    python setup.py build_ext --inplace
+
+Nothing else imports this file; deployments without a toolchain can
+ignore it.
+"""
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    raise SystemExit(
+        "Cython is not installed - this build step is optional. "
+        "Run 'pip install cython' first if you want the compiled helpers."
+    )
+
+setup(
+    name='streamsong-dashboard-helpers',
+    ext_modules=cythonize(
+        ['modules/utils/helpers.py'],
+        compiler_directives={'language_level': 3},
+    ),
+)